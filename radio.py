@@ -1,27 +1,135 @@
 import os
+import sys
 import subprocess
 import json
-import requests
+import signal
 from colorama import Fore, Style, init
 from math import ceil
 import shutil
-import glob
+import itertools
+import functools
+import importlib.util
+import tempfile
+from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Optional
 import threading
-import queue
+import collections
+import selectors
+from concurrent.futures import ThreadPoolExecutor
+import re
+import unicodedata
 import time
-from datetime import datetime
 
-init(autoreset=True)
+if os.name == 'nt':
+    import msvcrt
+else:
+    import termios
+    import tty
+
+def enable_vt_mode() -> bool:
+    """Let the Windows 10+ console interpret ANSI escapes itself."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+if os.name == 'nt' and enable_vt_mode():
+    # Pass escapes straight through instead of translating each one into console API calls
+    init(autoreset=True, convert=False, strip=False)
+else:
+    init(autoreset=True)
 
 # Enhanced Constants
 PLAYLIST_DIR = "./playlist/"
 DEFAULT_STATION_FILE = os.path.join(PLAYLIST_DIR, "list.m3u")
 STATIONS_PER_PAGE = 12
 CONFIG_FILE = "radio_config.json"
-HISTORY_FILE = "play_history.json"
+HISTORY_FILE = "play_history.jsonl"  # One JSON entry per line, appended on every play
+LEGACY_HISTORY_FILE = "play_history.json"
 FAVORITES_FILE = os.path.join(PLAYLIST_DIR, "favorites.m3u")
 MAX_HISTORY_ENTRIES = 50
+HISTORY_COMPACT_AT = 4 * MAX_HISTORY_ENTRIES  # Rewrite the history file once it holds this many lines
+SINGLE_KEY_COMMANDS = set("np<>+-mkfvcshe/jad")  # Act on keypress; station numbers still need Enter
+STATUS_POLL_INTERVAL = 0.2  # Seconds the Windows prompt waits for input before checking playback status
+URL_CACHE_FILE = "url_cache.json"
+URL_CACHE_TTL = 3600  # Seconds to trust a probe when the server gives no freshness info
+URL_CACHE_MAX_ENTRIES = 256
+FILTER_CACHE_MAX_ENTRIES = 32  # Memoized search results kept across all station sources
+URL_PROBE_FAILURE_TTL = 300  # Seconds before a URL whose probe failed is tried again
+JSON_SEPARATORS = (',', ':')  # Compact JSON for the files rewritten on every play
+USER_AGENT = "StreamScape/1.0"
+DIRECT_STREAM_EXTENSIONS = ('.mp3', '.aac', '.ogg', '.opus')  # Played as-is, no HTTP probe needed
+PLAYLIST_READ_LIMIT = 64 * 1024  # Give up on playlist bodies that show no stream URL by here
+
+# First stream URL in an M3U/M3U8 body or a PLS "FileN=" entry
+PLAYLIST_URL_RE = re.compile(rb'(?im)^\s*(?:file\d+=)?\s*(https?://\S+)\s*$')
+ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+# Station row templates: number, favorite marker, name
+STATION_ROW = f"{Fore.YELLOW}%3d. %s{Fore.WHITE}%s "
+STATION_ROW_PLAYING = STATION_ROW + f"{Fore.GREEN}◄-- PLAYING"
+
+# Home the cursor, then clear the screen and the scrollback
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+# Static menu and help text, formatted once instead of on every redraw
+SEPARATOR = f"{Fore.CYAN}{'=' * 50}"
+VIEW_TITLES = {
+    "all": f"{Fore.CYAN}All Stations",
+    "favorites": f"{Fore.CYAN}Favorites",
+    "history": f"{Fore.CYAN}Recently Played",
+}
+MENU_CONTROLS = (
+    "",
+    f"{Fore.CYAN}Playback:",
+    f"{Fore.GREEN}  [+/-] - Volume Up/Down  {Fore.GREEN}[m] - Mute/Unmute",
+    f"{Fore.GREEN}  [k]   - Play/Pause      {Fore.GREEN}[f] - Toggle Favorite",
+    "",
+    f"{Fore.CYAN}Navigation:",
+    f"{Fore.GREEN}  [/] - Search   {Fore.GREEN}[</>] - Prev/Next page",
+    f"{Fore.GREEN}  [n] - Next     {Fore.GREEN}[p]   - Previous station",
+    f"{Fore.GREEN}  [j] - Jump to  {Fore.GREEN}[c]   - Clear search",
+    "",
+    f"{Fore.CYAN}Views:",
+    f"{Fore.GREEN}  [v] - Switch view (All/Favorites/History)",
+    f"{Fore.GREEN}  [s] - Switch playlist",
+    "",
+    f"{Fore.CYAN}Other:",
+    f"{Fore.GREEN}  [a] - Add station   {Fore.GREEN}[d] - Delete station",
+    f"{Fore.GREEN}  [h] - Help          {Fore.RED}[e] - Exit",
+)
+HELP_TEXT = "\n".join([
+    f"{Fore.CYAN}Radio Player Help",
+    SEPARATOR,
+    f"{Fore.YELLOW}Playback:",
+    f"{Fore.WHITE}  +/- - Volume Up/Down ",
+    f"{Fore.WHITE}  m   - Mute/Unmute",
+    f"{Fore.WHITE}  k   - Play/Pause",
+    f"{Fore.WHITE}  f   - Toggle Favorite",
+    f"{Fore.YELLOW}Navigation:",
+    f"{Fore.WHITE}  </> - Navigate between pages",
+    f"{Fore.WHITE}  n/p - Next/Previous station",
+    f"{Fore.WHITE}  j   - Jump to specific station",
+    f"{Fore.WHITE}  /   - Search stations",
+    f"{Fore.WHITE}  c   - Clear search",
+    "",
+    f"{Fore.YELLOW}Playlist Management:",
+    f"{Fore.WHITE}  s   - Switch between playlists",
+    f"{Fore.WHITE}  v   - Switch view (All/Favorites/History)",
+    f"{Fore.WHITE}  a   - Add new station",
+    f"{Fore.WHITE}  d   - Delete station",
+    "",
+    f"{Fore.YELLOW}Other Commands:",
+    f"{Fore.WHITE}  h   - Show this help",
+    f"{Fore.WHITE}  e   - Exit program",
+])
 
 # Basic dependencies - just ffmpeg and curl
 REQUIRED_PACKAGES = {
@@ -39,13 +147,19 @@ REQUIRED_PACKAGES = {
     }
 }
 
+@functools.lru_cache(maxsize=None)
+def find_command(cmd: str) -> Optional[str]:
+    """Locate an executable on PATH; installed binaries don't change during a run."""
+    return shutil.which(cmd)
+
+@functools.lru_cache(maxsize=None)
 def detect_package_manager():
     """Detect the system's package manager."""
-    if shutil.which('apt-get'):
+    if find_command('apt-get'):
         return 'debian'
-    elif shutil.which('dnf'):
+    elif find_command('dnf'):
         return 'fedora'
-    elif shutil.which('brew'):
+    elif find_command('brew'):
         return 'brew'
     return None
 
@@ -57,7 +171,7 @@ def check_dependencies():
     }
 
     for cmd in required_cmds:
-        if shutil.which(cmd):
+        if find_command(cmd):
             required_cmds[cmd] = True
 
     missing = [cmd for cmd, installed in required_cmds.items() if not installed]
@@ -81,62 +195,261 @@ def check_dependencies():
         print(f"\n{Fore.YELLOW}Also make sure you have python requests installed:")
         print(f"{Fore.WHITE}pip install requests")
         return False
+
+    # requests is only imported on the first probe, so look for it up front
+    if importlib.util.find_spec("requests") is None:
+        print(f"{Fore.RED}Missing required Python package: requests")
+        print(f"{Fore.WHITE}pip install requests")
+        return False
     return True
 
+def create_http_session() -> "requests.Session":
+    """Create a pooled session so probes to the same host reuse connections."""
+    # requests and urllib3 take a noticeable share of startup; load them on first probe
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=1, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def http_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_http_session()
+    return _http_session
+
+def display_width(line: str) -> int:
+    """Count the terminal columns a line takes, ignoring color codes."""
+    text = ANSI_ESCAPE_RE.sub('', line)
+    # Emoji and CJK characters take two columns
+    return len(text) + sum(unicodedata.east_asian_width(ch) in 'WF' for ch in text if ord(ch) > 0x7f)
+
+def is_direct_stream(url: str) -> bool:
+    """Check whether a URL obviously points at an audio stream rather than a playlist."""
+    return url.lower().split('?', 1)[0].endswith(DIRECT_STREAM_EXTENSIONS)
+
 def get_content_type(url):
     """Detect the content type of the stream."""
     try:
-        response = requests.head(url, timeout=5, allow_redirects=True)
+        response = http_session().head(url, timeout=5, allow_redirects=True)
         content_type = response.headers.get('Content-Type', '').lower()
         return content_type.split(';')[0]  # Remove charset info if present
     except Exception as e:
         print(f"{Fore.YELLOW}Warning: Could not detect content type: {str(e)}")
         return None
 
+@dataclass
+class Playlist:
+    """Stations kept as parallel name and URL lists instead of a list of (name, url) tuples."""
+    names: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    _names_lower: Optional[List[str]] = field(default=None, repr=False, compare=False)
+    _name_index: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self):
+        return zip(self.names, self.urls)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return list(zip(self.names[idx], self.urls[idx]))
+        return self.names[idx], self.urls[idx]
+
+    def __delitem__(self, idx: int):
+        del self.names[idx]
+        del self.urls[idx]
+        if self._names_lower is not None:
+            del self._names_lower[idx]
+        # Every later index shifts, so rebuild the name lookup on next use
+        self._name_index = None
+
+    def append(self, station: Tuple[str, str]):
+        """Add a (name, url) station to the end, keeping the search indexes current."""
+        name, url = station
+        self.names.append(name)
+        self.urls.append(url)
+        if self._names_lower is not None:
+            self._names_lower.append(name.casefold())
+        if self._name_index is not None:
+            self._name_index.setdefault(name, len(self.names) - 1)
+
+    def remove(self, station: Tuple[str, str]):
+        """Remove the first occurrence of a (name, url) station."""
+        name, url = station
+        for i, (n, u) in enumerate(self):
+            if n == name and u == url:
+                del self[i]
+                return
+        raise ValueError(f"{station!r} not in playlist")
+
+    @property
+    def names_lower(self) -> List[str]:
+        """Casefolded station names, built on first search."""
+        if self._names_lower is None:
+            self._names_lower = [name.casefold() for name in self.names]
+        return self._names_lower
+
+    def name_index(self) -> Dict[str, int]:
+        """Map each station name to the index of its first occurrence."""
+        if self._name_index is None:
+            index: Dict[str, int] = {}
+            for i, name in enumerate(self.names):
+                index.setdefault(name, i)
+            self._name_index = index
+        return self._name_index
+
+    def subset(self, indices: List[int]) -> "Playlist":
+        """Return a new playlist holding only the stations at the given indices."""
+        names, urls = self.names, self.urls
+        return Playlist([names[i] for i in indices], [urls[i] for i in indices])
+
+def parse_m3u(lines) -> Playlist:
+    """Parse station names and URLs out of raw .m3u lines."""
+    stations = Playlist()
+    add_name = stations.names.append
+    add_url = stations.urls.append
+    current_name = ""
+    for line in lines:
+        line = line.strip()
+        if line.startswith(b"#EXTINF"):
+            # Extract the name from the #EXTINF line
+            current_name = line[line.find(b",") + 1:].strip().decode('utf-8', 'replace')
+        elif line and not line.startswith(b"#"):
+            # The URL line follows the #EXTINF line
+            add_name(current_name)
+            add_url(line.decode('utf-8', 'replace'))
+    return stations
+
+def cache_expiry(headers) -> float:
+    """Work out when a cached probe expires from its Cache-Control/Expires headers."""
+    from email.utils import parsedate_to_datetime
+    now = time.time()
+    max_age = re.search(r'max-age=(\d+)', headers.get('Cache-Control', ''))
+    if max_age and int(max_age.group(1)) > 0:
+        return now + int(max_age.group(1))
+    try:
+        expires = parsedate_to_datetime(headers.get('Expires', '')).timestamp()
+        if expires > now:
+            return expires
+    except (TypeError, ValueError):
+        pass
+    # Streaming servers routinely mark the live body as uncacheable, which says
+    # nothing about its content type or where a playlist points.
+    return now + URL_CACHE_TTL
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write data to path in one go, replacing the old file only once the new one is complete."""
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or '.', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp.name)
+        else:
+            # NamedTemporaryFile is private (0600); give new files the usual permissions
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, path)
+    except Exception:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+def find_playlist_url(response) -> Optional[str]:
+    """Scan a streamed playlist body for its first stream URL, stopping as soon as one turns up."""
+    buf = bytearray()
+    searched = 0
+    for chunk in response.iter_content(chunk_size=8192):
+        buf += chunk
+        # Only search lines completed by this chunk, so a URL split across
+        # chunks isn't cut short and earlier lines aren't scanned twice
+        end = buf.rfind(b"\n") + 1
+        match = PLAYLIST_URL_RE.search(buf, searched, end)
+        if match:
+            return match.group(1).decode('utf-8', 'replace')
+        searched = max(searched, end)
+        if len(buf) >= PLAYLIST_READ_LIMIT:
+            return None
+
+    # The body ended without a trailing newline
+    match = PLAYLIST_URL_RE.search(buf, searched)
+    return match.group(1).decode('utf-8', 'replace') if match else None
+
 def resolve_playlist(url):
     """Resolve playlist URLs to get the actual stream URL."""
     try:
-        response = requests.get(url, timeout=5)
-        content = response.text.lower()
-
-        # Handle M3U/M3U8 playlists
-        if 'http' in content:
-            for line in content.splitlines():
-                if line.startswith('http'):
-                    return line.strip()
-
-        # Handle PLS playlists
-        if '[playlist]' in content:
-            for line in content.splitlines():
-                if line.startswith('file1='):
-                    return line.replace('file1=', '').strip()
-
-        return url  # Return original URL if no stream URL found
+        with http_session().get(url, timeout=5, stream=True) as response:
+            stream_url = find_playlist_url(response)
+
+        return stream_url or url  # Return original URL if no stream URL found
     except Exception as e:
         print(f"{Fore.YELLOW}Warning: Could not resolve playlist: {str(e)}")
         return url
 
+def ffplay_command(url: str, volume: Optional[float] = None) -> List[str]:
+    """Build the ffplay command line for a stream, tuned to start playing quickly."""
+    cmd = [
+        "ffplay",
+        "-nodisp",                      # No video display
+        "-hide_banner",                 # Hide ffplay banner
+        "-loglevel", "panic",           # Minimal logging
+        "-vn",                          # Skip video
+        "-fflags", "nobuffer",          # Don't buffer input before decoding
+        "-flags", "low_delay",
+        "-probesize", "32",             # Start decoding without a long format probe
+        "-analyzeduration", "0",
+        "-autoexit",                    # Exit when stream ends
+    ]
+    if volume is not None:
+        cmd += ["-af", f"volume={volume}"]
+    if url.lower().split('?', 1)[0].endswith('.m3u8'):
+        # HLS delivers whole segments and stutters without a deep buffer
+        cmd.append("-infbuf")
+    cmd.append(url)
+    return cmd
+
 def play_station(url, player_process):
     """Play a radio station using ffplay."""
     stop_station(player_process)
 
     try:
         # Check if it's a playlist first
-        content_type = get_content_type(url)
-        if content_type and 'playlist' in content_type:
-            url = resolve_playlist(url)
+        if not is_direct_stream(url):
+            content_type = get_content_type(url)
+            if content_type and 'playlist' in content_type:
+                url = resolve_playlist(url)
 
         # Use ffplay with optimized settings for streaming
-        player_process["process"] = subprocess.Popen([
-            "ffplay",
-            "-nodisp",              # No video display
-            "-hide_banner",         # Hide ffplay banner
-            "-loglevel", "panic",   # Minimal logging
-            "-vn",                  # Skip video
-            "-infbuf",             # Infinite buffer (good for streams)
-            "-autoexit",           # Exit when stream ends
-            url
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        player_process["process"] = subprocess.Popen(
+            ffplay_command(url),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True
+        )
 
         print(f"{Fore.GREEN}Playing stream... Press any key to access menu.")
 
@@ -144,69 +457,80 @@ def play_station(url, player_process):
         print(f"{Fore.RED}Error playing stream: {str(e)}")
         input("Press Enter to continue.")
 
+def terminate_player(process):
+    """Terminate ffplay together with anything else in its process group."""
+    if os.name == 'nt':
+        process.terminate()
+        return
+    if process.poll() is None:
+        try:
+            # ffplay runs in its own session, so its pid is also the group id
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
 def stop_station(player_process):
     """Stop the currently playing station."""
     if player_process.get("process"):
-        player_process["process"].terminate()
+        terminate_player(player_process["process"])
         player_process["process"] = None
 
-def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def filter_stations(stations: List[Tuple[str, str]], search_term: str) -> List[Tuple[str, str]]:
-    """Filter stations based on search term."""
-    if not search_term:
-        return stations
-    return [(name, link) for name, link in stations if search_term.lower() in name.lower()]
-
 def display_help():
     """Display help information."""
-    clear_screen()
-    print(f"{Fore.CYAN}Radio Player Help")
-    print(f"{Fore.CYAN}{'=' * 50}")
-    print(f"{Fore.YELLOW}Playback:")
-    print(f"{Fore.WHITE}  +/- - Volume Up/Down ")
-    print(f"{Fore.WHITE}  m   - Mute/Unmute")
-    print(f"{Fore.WHITE}  k   - Play/Pause")
-    print(f"{Fore.WHITE}  f   - Toggle Favorite")
-
-    print(f"{Fore.YELLOW}Navigation:")
-    print(f"{Fore.WHITE}  </> - Navigate between pages")
-    print(f"{Fore.WHITE}  n/p - Next/Previous station")
-    print(f"{Fore.WHITE}  j   - Jump to specific station")
-    print(f"{Fore.WHITE}  /   - Search stations")
-    print(f"{Fore.WHITE}  c   - Clear search")
-
-    print(f"\n{Fore.YELLOW}Playlist Management:")
-    print(f"{Fore.WHITE}  s   - Switch between playlists")
-    print(f"{Fore.WHITE}  v   - Switch view (All/Favorites/History)")
-    print(f"{Fore.WHITE}  a   - Add new station")
-    print(f"{Fore.WHITE}  d   - Delete station")
-
-    print(f"\n{Fore.YELLOW}Other Commands:")
-    print(f"{Fore.WHITE}  h   - Show this help")
-    print(f"{Fore.WHITE}  e   - Exit program")
+    # Clear and draw in a single write so the screen doesn't flash between the two
+    sys.stdout.write(CLEAR_SCREEN + HELP_TEXT + "\n")
+    sys.stdout.flush()
 
     input(f"\n{Fore.GREEN}Press Enter to return to menu...")
 
 class RadioPlayer:
     def __init__(self):
         self.current_playlist = DEFAULT_STATION_FILE
-        self.playlists: Dict[str, List[Tuple[str, str]]] = {}
-        self.favorites: List[Tuple[str, str]] = []
+        self.playlists: Dict[str, Playlist] = {}
+        self.favorites = Playlist()
+        # Set views of self.favorites for O(1) membership checks while rendering
+        self._favorites_names: set = set()
+        self._favorites_pairs: set = set()
         self.current_station = 0
         self.is_playing = False
         self.last_played_station = None
         self.player_process = None
         self.current_page = 1
         self.search_term = ""
-        self.status_queue = queue.Queue()
+        # Status messages from the monitor thread; deque append/popleft are atomic
+        self._status_dq = collections.deque(maxlen=64)
+        self._status_event = threading.Event()
+        self._player_lock = threading.Lock()
+        self._play_token = 0  # Bumped on every stop so late spawns can tell they are stale
+        self._spawn_pool = ThreadPoolExecutor(max_workers=1)
+        self._stream_url = None  # Resolved URL of the current stream
+
+        # Self-pipe the monitor thread writes to so a waiting menu prompt wakes up
+        self._wake_r = self._wake_w = None
+        if os.name != 'nt':
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
         self.current_station_name = None
         self.play_history = []
+        self._history_fp = None
+        self._history_lines = 0
         self.volume = 100
         self.is_muted = False
         self.view_mode = "all"  # Can be "all", "favorites", "history"
+        self._prev_lines: List[str] = []
+        self._prev_size = None
+        self._filter_cache: Dict[Tuple[str, str], List[int]] = {}
+        self._history_view: Optional[Playlist] = None
+        self._stations_gen = 0
+        self._playlist_mtimes: Dict[str, float] = {}
+        self._menu_cache_key = None
+        self._menu_cache = None
+        self._url_cache: Dict[str, dict] = {}
+
+        # Background probes that warm the URL cache for the visible page
+        self._cache_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=8)
+        self._inflight: set = set()
 
         # Ensure playlist directory exists
         self.ensure_playlist_dir()
@@ -230,6 +554,9 @@ class RadioPlayer:
                     config = json.load(f)
                     self.current_playlist = config.get('current_playlist', self.current_playlist)
                     self.last_played_station = config.get('last_played_station', None)
+            if os.path.exists(URL_CACHE_FILE):
+                with open(URL_CACHE_FILE, 'r') as f:
+                    self._url_cache = json.load(f)
         except Exception as e:
             print(f"Warning: Could not load config: {str(e)}")
 
@@ -240,48 +567,64 @@ class RadioPlayer:
                 'current_playlist': self.current_playlist,
                 'last_played_station': self.last_played_station
             }
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f)
+            atomic_write_bytes(CONFIG_FILE, json.dumps(config, separators=JSON_SEPARATORS).encode())
         except Exception as e:
             print(f"Warning: Could not save config: {str(e)}")
 
+    def save_url_cache(self):
+        """Save the still-fresh URL probes so the next start can skip them."""
+        try:
+            now = time.time()
+            with self._cache_lock:
+                url_cache = {key: entry for key, entry in self._url_cache.items() if entry['expires'] > now}
+            atomic_write_bytes(URL_CACHE_FILE, json.dumps(url_cache, separators=JSON_SEPARATORS).encode())
+        except Exception as e:
+            print(f"Warning: Could not save URL cache: {str(e)}")
+
     def load_all_playlists(self):
-        """Load all .m3u files as potential playlists."""
-        self.playlists.clear()
-        for playlist_file in glob.glob(os.path.join(PLAYLIST_DIR, "*.m3u")):
-            stations = self.load_stations(playlist_file)
-            if stations:
-                self.playlists[playlist_file] = stations
-
-    def load_stations(self, filename: str) -> List[Tuple[str, str]]:
+        """Load all .m3u files as potential playlists, re-parsing only files that changed."""
+        seen = set()
+        with os.scandir(PLAYLIST_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".m3u") or not entry.is_file():
+                    continue
+                playlist_file = os.path.join(PLAYLIST_DIR, entry.name)
+                seen.add(playlist_file)
+                mtime = entry.stat().st_mtime
+                if self._playlist_mtimes.get(playlist_file) == mtime:
+                    continue
+
+                stations = self.load_stations(playlist_file)
+                if stations:
+                    self.playlists[playlist_file] = stations
+                else:
+                    self.playlists.pop(playlist_file, None)
+                self._playlist_mtimes[playlist_file] = mtime
+                self.stations_changed(playlist_file)
+
+        # Forget playlists whose files have disappeared
+        for playlist_file in set(self._playlist_mtimes) - seen:
+            del self._playlist_mtimes[playlist_file]
+            self.playlists.pop(playlist_file, None)
+            self.stations_changed(playlist_file)
+
+    def load_stations(self, filename: str) -> Playlist:
         """Load stations from a specific .m3u file."""
         if not os.path.exists(filename):
-            return []
+            return Playlist()
         try:
-            with open(filename, 'r') as file:
-                lines = file.read().strip().split("\n")
-                stations = []
-                current_name = ""
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("#EXTINF"):
-                        # Extract the name from the #EXTINF line
-                        current_name = line.split(",", 1)[-1].strip()
-                    elif line and not line.startswith("#"):
-                        # The URL line follows the #EXTINF line
-                        stations.append((current_name, line))
-                return stations
+            # Iterate the raw bytes line by line instead of reading and splitting the whole file
+            with open(filename, 'rb', buffering=1 << 20) as file:
+                return parse_m3u(file)
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not load stations from {filename}: {str(e)}")
-            return []
+            return Playlist()
 
-    def save_stations(self, stations: List[Tuple[str, str]], filename: str):
+    def save_stations(self, stations: Playlist, filename: str):
         """Save stations to a specific .m3u file."""
         try:
-            with open(filename, 'w') as file:
-                file.write("#EXTM3U\n")
-                for name, link in stations:
-                    file.write(f"#EXTINF:-1,{name}\n{link}\n")
+            data = "#EXTM3U\n" + "".join(f"#EXTINF:-1,{name}\n{link}\n" for name, link in stations)
+            atomic_write_bytes(filename, data.encode('utf-8'))
         except Exception as e:
             print(f"{Fore.RED}Error saving stations to {filename}: {str(e)}")
 
@@ -290,6 +633,7 @@ class RadioPlayer:
         try:
             if os.path.exists(FAVORITES_FILE):
                 self.favorites = self.load_stations(FAVORITES_FILE)
+                self.favorites_changed()
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not load favorites: {str(e)}")
 
@@ -300,12 +644,50 @@ class RadioPlayer:
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not save favorites: {str(e)}")
 
-    def get_current_stations(self) -> List[Tuple[str, str]]:
+    def get_current_stations(self) -> Playlist:
         """Get stations from current playlist."""
-        return self.playlists.get(self.current_playlist, [])
+        return self.playlists.get(self.current_playlist) or Playlist()
+
+    def get_history_stations(self) -> Playlist:
+        """Get the play history as stations, most recent first."""
+        if self._history_view is None:
+            entries = self.play_history[::-1]
+            self._history_view = Playlist([entry['name'] for entry in entries], [entry['url'] for entry in entries])
+        return self._history_view
+
+    def stations_changed(self, source: str):
+        """Forget memoized search results for a playlist, favorites or history after it changed."""
+        self._stations_gen += 1
+        if source == "history":
+            self._history_view = None
+        for key in [key for key in self._filter_cache if key[0] == source]:
+            del self._filter_cache[key]
+
+    def current_name_index(self) -> Dict[str, int]:
+        """Map station names in the current playlist to their index."""
+        return self.get_current_stations().name_index()
+
+    def filter_stations(self, source: str, stations: Playlist) -> Playlist:
+        """Filter stations based on search term, memoized per station source."""
+        if not self.search_term:
+            return stations
+        key = (source, self.search_term)
+        indices = self._filter_cache.get(key)
+        if indices is None:
+            names = stations.names_lower
+            term = self.search_term.casefold()
+            # Substring tests run in C via map/compress rather than a Python-level loop
+            matches = map(str.__contains__, names, itertools.repeat(term))
+            indices = self._filter_cache[key] = list(itertools.compress(range(len(names)), matches))
+            # Every search term typed adds an entry; forget the oldest ones
+            while len(self._filter_cache) > FILTER_CACHE_MAX_ENTRIES:
+                del self._filter_cache[next(iter(self._filter_cache))]
+        return stations.subset(indices)
 
     def get_stream_url(self, url: str) -> str:
         """Resolve the actual stream URL from potentially a playlist URL."""
+        if is_direct_stream(url):
+            return url
         try:
             content_type = self.get_content_type(url)
             if content_type and ('playlist' in content_type or '.m3u' in url.lower() or '.pls' in url.lower()):
@@ -315,57 +697,98 @@ class RadioPlayer:
             print(f"{Fore.YELLOW}Warning: Could not resolve stream URL: {str(e)}")
             return url
 
+    def cached_probe(self, method: str, url: str) -> Optional[str]:
+        """Return a still-fresh cached probe result for this method and URL."""
+        key = f"{method} {url}"
+        with self._cache_lock:
+            entry = self._url_cache.pop(key, None)
+            if entry is None or time.time() >= entry['expires']:
+                return None
+            # Re-insert so the dict stays ordered from least to most recently used
+            self._url_cache[key] = entry
+        return entry['value']
+
+    def cache_probe(self, method: str, url: str, value: str, expires: float):
+        """Remember a probe result until the given expiry time."""
+        entry = {'value': value, 'expires': expires}
+        key = f"{method} {url}"
+        with self._cache_lock:
+            self._url_cache.pop(key, None)
+            self._url_cache[key] = entry
+            while len(self._url_cache) > URL_CACHE_MAX_ENTRIES:
+                del self._url_cache[next(iter(self._url_cache))]
+
+    def prefetch_urls(self, urls: List[str]):
+        """Warm the URL cache for stations the user is likely to pick next."""
+        for url in urls:
+            if url in self._inflight or is_direct_stream(url) or self.cached_probe('HEAD', url) is not None:
+                continue
+            with self._cache_lock:
+                self._inflight.add(url)
+            self._prefetch_pool.submit(self._warm_url, url)
+
+    def _warm_url(self, url: str):
+        """Resolve a station URL in the background so playing it is a cache hit."""
+        try:
+            self.get_stream_url(url)
+        finally:
+            with self._cache_lock:
+                self._inflight.discard(url)
+
     def get_content_type(self, url: str) -> Optional[str]:
         """Get content type of the URL."""
+        cached = self.cached_probe('HEAD', url)
+        if cached is not None:
+            return cached
         try:
-            response = requests.head(url, timeout=5, allow_redirects=True)
+            response = http_session().head(url, timeout=5, allow_redirects=True)
             content_type = response.headers.get('Content-Type', '').lower()
-            return content_type.split(';')[0]
+            content_type = content_type.split(';')[0]
+            self.cache_probe('HEAD', url, content_type, cache_expiry(response.headers))
+            return content_type
         except Exception:
+            # Plenty of stream servers reject HEAD or answer with a bare ICY status line;
+            # remember that as "unknown type" so redraws don't keep re-probing them
+            self.cache_probe('HEAD', url, "", time.time() + URL_PROBE_FAILURE_TTL)
             return None
 
     def resolve_playlist(self, url: str) -> str:
         """Resolve playlist URL to get the actual stream URL."""
+        cached = self.cached_probe('GET', url)
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(url, timeout=5)
-            content = response.text.lower()
-
-            # Handle M3U/M3U8 playlists
-            if 'http' in content:
-                for line in content.splitlines():
-                    if line.startswith('http'):
-                        return line.strip()
-
-            # Handle PLS playlists
-            if '[playlist]' in content:
-                for line in content.splitlines():
-                    if line.startswith('file1='):
-                        return line.replace('file1=', '').strip()
+            # Handles both M3U/M3U8 and PLS playlists
+            with http_session().get(url, timeout=5, stream=True) as response:
+                resolved = find_playlist_url(response)
 
-            return url
+            if resolved:
+                self.cache_probe('GET', url, resolved, cache_expiry(response.headers))
+                return resolved
         except Exception:
-            return url
-
-    def check_playback_status(self) -> bool:
-        """Check if the station is actually playing."""
-        if self.player_process is None:
-            return False
-
-        # Check if process is still running
-        return self.player_process.poll() is None
-
-    def monitor_playback(self):
-        """Monitor playback status in a separate thread with improved status tracking."""
-        while True:
-            current_status = self.check_playback_status()
+            pass
+        # Play the URL as-is and don't fetch it again until the failure entry expires
+        self.cache_probe('GET', url, url, time.time() + URL_PROBE_FAILURE_TTL)
+        return url
 
-            if self.is_playing and not current_status:
+    def monitor_playback(self, process: subprocess.Popen, token: int):
+        """Block until this player exits and report it if it was still the current one."""
+        process.wait()
+        # Checked and reported under the lock so a station started meanwhile,
+        # which bumps the token first, can't have its state cleared
+        with self._player_lock:
+            if token == self._play_token:
                 # Playback stopped unexpectedly
-                self.is_playing = False
-                self.current_station_name = None
-                self.status_queue.put("stopped")
+                self.notify_stopped()
 
-            time.sleep(1)
+    def notify_stopped(self):
+        """Mark playback as stopped and wake the menu so it can show it."""
+        self.is_playing = False
+        self.current_station_name = None
+        self._status_dq.append("stopped")
+        self._status_event.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"x")
 
     def resume_last_station(self):
         """Resume playback of the last played station."""
@@ -379,16 +802,17 @@ class RadioPlayer:
 
     def switch_playlist(self):
         """Switch between available playlists."""
-        clear_screen()
-        print(f"{Fore.CYAN}Available Playlists:")
+        # Pick up playlists added or edited on disk; unchanged files are not re-parsed
+        self.load_all_playlists()
         playlists = list(self.playlists.keys())
 
+        lines = [CLEAR_SCREEN + f"{Fore.CYAN}Available Playlists:"]
         for i, playlist in enumerate(playlists, 1):
             current = " (current)" if playlist == self.current_playlist else ""
-            print(f"{Fore.YELLOW}{i}. {Fore.WHITE}{playlist}{Fore.GREEN}{current}")
-
-        print(f"\n{Fore.YELLOW}[n] Create new playlist")
-        print(f"{Fore.YELLOW}[c] Cancel")
+            lines.append(f"{Fore.YELLOW}{i}. {Fore.WHITE}{playlist}{Fore.GREEN}{current}")
+        lines += ["", f"{Fore.YELLOW}[n] Create new playlist", f"{Fore.YELLOW}[c] Cancel", ""]
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
         choice = input("\nEnter your choice: ").strip().lower()
 
@@ -397,7 +821,7 @@ class RadioPlayer:
             if not filename.endswith('.txt'):
                 filename += '.txt'
             if not os.path.exists(filename):
-                self.playlists[filename] = []
+                self.playlists[filename] = Playlist()
                 self.current_playlist = filename
                 self.save_config()
         elif choice.isdigit():
@@ -408,30 +832,58 @@ class RadioPlayer:
 
     def toggle_favorite(self, station: Tuple[str, str]):
         """Add or remove station from favorites."""
-        if station in self.favorites:
+        if station in self._favorites_pairs:
             self.favorites.remove(station)
             print(f"{Fore.YELLOW}Removed from favorites: {station[0]}")
         else:
             self.favorites.append(station)
             print(f"{Fore.GREEN}Added to favorites: {station[0]}")
+        self.favorites_changed()
         self.save_favorites()
 
+    def favorites_changed(self):
+        """Rebuild the favorites lookup sets and search index after self.favorites changed."""
+        self._favorites_names = set(self.favorites.names)
+        self._favorites_pairs = set(self.favorites)
+        self.stations_changed("favorites")
+
     def load_history(self):
         """Load play history from file."""
         try:
             if os.path.exists(HISTORY_FILE):
-                with open(HISTORY_FILE, 'r') as f:
-                    self.play_history = json.load(f)
-                    # Keep only the last MAX_HISTORY_ENTRIES
-                    self.play_history = self.play_history[-MAX_HISTORY_ENTRIES:]
+                entries = []
+                with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entries.append(json.loads(line))
+                        except ValueError:
+                            pass  # Torn or blank line from an interrupted append
+                self._history_lines = len(entries)
+            elif os.path.exists(LEGACY_HISTORY_FILE):
+                with open(LEGACY_HISTORY_FILE, 'r') as f:
+                    entries = json.load(f)
+                # Force a rewrite into the line-based format
+                self._history_lines = HISTORY_COMPACT_AT
+            else:
+                return
+
+            # Keep only the last MAX_HISTORY_ENTRIES
+            self.play_history = entries[-MAX_HISTORY_ENTRIES:]
+            self.stations_changed("history")
+            if self._history_lines >= HISTORY_COMPACT_AT:
+                self.save_history()
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not load history: {str(e)}")
 
     def save_history(self):
-        """Save play history to file."""
+        """Rewrite the history file with only the retained entries."""
         try:
-            with open(HISTORY_FILE, 'w') as f:
-                json.dump(self.play_history, f)
+            if self._history_fp is not None:
+                self._history_fp.close()
+                self._history_fp = None
+            data = "".join(json.dumps(entry, separators=JSON_SEPARATORS) + "\n" for entry in self.play_history)
+            atomic_write_bytes(HISTORY_FILE, data.encode('utf-8'))
+            self._history_lines = len(self.play_history)
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not save history: {str(e)}")
 
@@ -440,12 +892,25 @@ class RadioPlayer:
         entry = {
             'name': station_name,
             'url': station_url,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         self.play_history.append(entry)
         if len(self.play_history) > MAX_HISTORY_ENTRIES:
             self.play_history.pop(0)
-        self.save_history()
+        self.stations_changed("history")
+
+        if self._history_lines >= HISTORY_COMPACT_AT:
+            self.save_history()
+            return
+        try:
+            # Append just the new entry instead of rewriting the whole history
+            if self._history_fp is None:
+                self._history_fp = open(HISTORY_FILE, 'a', encoding='utf-8')
+            self._history_fp.write(json.dumps(entry, separators=JSON_SEPARATORS) + "\n")
+            self._history_fp.flush()
+            self._history_lines += 1
+        except Exception as e:
+            print(f"{Fore.YELLOW}Warning: Could not save history: {str(e)}")
 
     def adjust_volume(self, direction: str):
         """Adjust playback volume."""
@@ -466,26 +931,79 @@ class RadioPlayer:
 
     def restart_playback_with_volume(self):
         """Restart playback with current volume settings."""
-        if self.current_station_name:
-            stations = self.get_current_stations()
-            station_info = next((s for s in stations if s[0] == self.current_station_name), None)
-            if station_info:
-                self.play_station(self.current_station, None, force_restart=True)
+        # ffplay ignores keyboard input without a video window, so a volume
+        # change still needs a new process; reuse the resolved stream URL and
+        # skip the probes, history entry and config write of a fresh play.
+        stream_url, name = self._stream_url, self.current_station_name
+        if not (self.is_playing and stream_url and name):
+            return
+        self.stop_station()
+        self.is_playing = True
+        self.current_station_name = name
+        self.start_player(stream_url)
 
     def stop_station(self):
         """Stop the currently playing station."""
-        if self.player_process:
+        with self._player_lock:
+            # Any ffplay still being spawned for the old station gets discarded
+            self._play_token += 1
+            process, self.player_process = self.player_process, None
+        self.is_playing = False
+        self.current_station_name = None
+        self._stream_url = None
+        if process:
             try:
-                self.player_process.terminate()
-                self.player_process = None
-                self.is_playing = False
-                self.current_station_name = None
+                terminate_player(process)
             except Exception:
                 pass
 
-    def play_station(self, station_idx: int, filtered_stations: List[Tuple[str, str]] = None, force_restart: bool = False):
+    def spawn_player(self, cmd: List[str], token: int):
+        """Start ffplay off the UI thread and install it unless playback moved on meanwhile."""
+        try:
+            # Nothing reads ffplay's output; unread pipes would eventually fill and stall playback
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True
+            )
+        except Exception:
+            with self._player_lock:
+                if token == self._play_token:
+                    self.notify_stopped()
+            return
+
+        with self._player_lock:
+            stale = token != self._play_token
+            if not stale:
+                self.player_process = process
+        if stale:
+            terminate_player(process)
+            # No monitor thread will reap this one, so collect it here
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        else:
+            # One short-lived watcher per playback session
+            threading.Thread(target=self.monitor_playback, args=(process, token), daemon=True).start()
+
+    def start_player(self, stream_url: str):
+        """Start ffplay on the stream with the current volume settings."""
+        # Calculate effective volume
+        effective_volume = 0 if self.is_muted else self.volume
+        cmd = ffplay_command(stream_url, effective_volume / 100)
+        self._stream_url = stream_url
+
+        # Spawning ffplay costs a fork+exec; keep it off the keystroke path
+        self._spawn_pool.submit(self.spawn_player, cmd, self._play_token)
+
+    def play_station(self, station_idx: int, filtered_stations: Playlist = None):
         """Enhanced play station with volume control and history."""
-        if not force_restart and self.is_playing and self.current_station == station_idx:
+        if self.is_playing and self.current_station == station_idx:
             return True
 
         self.stop_station()
@@ -502,32 +1020,15 @@ class RadioPlayer:
             print(f"{Fore.YELLOW}Loading station: {name}...")
 
             # Find the index in the original station list if using filtered results
-            all_stations = self.get_current_stations()
-            original_idx = next((i for i, (n, _) in enumerate(all_stations) if n == name), station_idx)
+            original_idx = self.current_name_index().get(name, station_idx)
 
             stream_url = self.get_stream_url(url)
 
-            # Calculate effective volume
-            effective_volume = 0 if self.is_muted else self.volume
-
-            # Build ffplay command with volume control
-            cmd = [
-                "ffplay",
-                "-nodisp",
-                "-hide_banner",
-                "-loglevel", "panic",
-                "-vn",
-                "-af", f"volume={effective_volume/100}",
-                "-infbuf",
-                "-autoexit",
-                stream_url
-            ]
-
-            self.player_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
             self.is_playing = True
             self.current_station = original_idx
             self.current_station_name = name
+            self.start_player(stream_url)
+
             self.last_played_station = {
                 'playlist': self.current_playlist,
                 'station_idx': original_idx
@@ -540,7 +1041,7 @@ class RadioPlayer:
 
             # Show status with volume
             volume_status = "🔇" if self.is_muted else f"🔊 {self.volume}%"
-            favorite_status = "⭐" if (name, url) in self.favorites else ""
+            favorite_status = "⭐" if (name, url) in self._favorites_pairs else ""
             print(f"{Fore.GREEN}Now playing: {name} {volume_status} {favorite_status}")
             print(f"{Fore.CYAN}Press any key to access menu")
             return True
@@ -551,81 +1052,214 @@ class RadioPlayer:
             self.current_station_name = None
             return False
 
-    def display_menu(self) -> List[Tuple[str, str]]:
+    def render_frame(self, lines: List[str]):
+        """Repaint the menu in place, rewriting only the lines that changed since the last frame."""
+        size = shutil.get_terminal_size()
+        # Prompts and status messages are printed below the menu and can scroll
+        # the screen when the frame is close to the terminal height, and a line
+        # wider than the terminal wraps onto the row below, so only position
+        # lines in place when the frame fits with room to spare.
+        if len(lines) + 6 > size.lines or any(display_width(line) > size.columns for line in lines):
+            # Absolute moves past the last row would pile up on it; let the frame scroll
+            sys.stdout.write(CLEAR_SCREEN + "\n".join(lines) + Style.RESET_ALL + "\n")
+            sys.stdout.flush()
+            self._prev_lines = []
+            self._prev_size = size
+            return
+        if size != self._prev_size:
+            self._prev_lines = []
+        self._prev_size = size
+
+        out = []
+        for y, line in enumerate(lines):
+            if y < len(self._prev_lines) and self._prev_lines[y] == line:
+                continue
+            out.append(f"\x1b[{y + 1};1H{line}{Style.RESET_ALL}\x1b[K")
+        # Drop whatever was printed below the menu since the last frame
+        out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._prev_lines = lines
+
+    def display_menu(self) -> Tuple[Playlist, Dict[str, int]]:
         """Enhanced menu display with favorites and history."""
-        clear_screen()
-
+        # Rebuild the frame only when something it shows has changed
+        key = (
+            self.view_mode, self.current_playlist, self.search_term, self.current_page,
+            self.is_playing, self.current_station_name, self.current_station,
+            self.volume, self.is_muted, self._stations_gen
+        )
+        if key != self._menu_cache_key:
+            self._menu_cache = self.build_menu()
+            self._menu_cache_key = key
+
+        lines, filtered_stations, name_to_idx, visible_urls = self._menu_cache
+        self.render_frame(lines)
+        self.prefetch_urls(visible_urls)
+        return filtered_stations, name_to_idx
+
+    def build_menu(self) -> Tuple[List[str], Playlist, Dict[str, int], List[str]]:
+        """Build the menu lines, the filtered stations with their name lookup, and the visible URLs."""
         # Get appropriate station list based on view mode
         if self.view_mode == "favorites":
-            stations = self.favorites
+            source, stations = "favorites", self.favorites
         elif self.view_mode == "history":
-            # Convert history entries to station format
-            stations = [(entry['name'], entry['url']) for entry in reversed(self.play_history)]
+            source, stations = "history", self.get_history_stations()
         else:
-            stations = self.get_current_stations()
+            source, stations = self.current_playlist, self.get_current_stations()
 
-        filtered_stations = filter_stations(stations, self.search_term)
+        filtered_stations = self.filter_stations(source, stations)
         total_pages = ceil(len(filtered_stations) / STATIONS_PER_PAGE)
         start_idx = (self.current_page - 1) * STATIONS_PER_PAGE
         end_idx = start_idx + STATIONS_PER_PAGE
 
         # Header with mode indicator
-        mode_text = {
-            "all": "All Stations",
-            "favorites": "Favorites",
-            "history": "Recently Played"
-        }[self.view_mode]
-
-        print(f"{Fore.CYAN}{mode_text} {Fore.YELLOW}[Page {self.current_page}/{max(1, total_pages)}]")
-        print(f"{Fore.CYAN}{'=' * 50}")
+        lines = [
+            f"{VIEW_TITLES[self.view_mode]} {Fore.YELLOW}[Page {self.current_page}/{max(1, total_pages)}]",
+            SEPARATOR,
+        ]
 
         # Playlist info
         if self.view_mode == "all":
-            print(f"{Fore.GREEN}Current Playlist: {self.current_playlist}")
+            lines.append(f"{Fore.GREEN}Current Playlist: {self.current_playlist}")
 
         # Playing status with volume
         if self.is_playing and self.current_station_name:
             volume_status = "🔇" if self.is_muted else f"🔊 {self.volume}%"
-            favorite_status = "⭐" if any(s[0] == self.current_station_name for s in self.favorites) else ""
-            print(f"{Fore.GREEN}Now Playing: {Fore.WHITE}{self.current_station_name} {volume_status} {favorite_status}")
-            print(f"{Fore.CYAN}{'=' * 50}")
+            favorite_status = "⭐" if self.current_station_name in self._favorites_names else ""
+            lines.append(f"{Fore.GREEN}Now Playing: {Fore.WHITE}{self.current_station_name} {volume_status} {favorite_status}")
+            lines.append(SEPARATOR)
 
         # Search status
         if self.search_term:
-            print(f"{Fore.YELLOW}Search: '{self.search_term}' ({len(filtered_stations)} results)")
+            lines.append(f"{Fore.YELLOW}Search: '{self.search_term}' ({len(filtered_stations)} results)")
 
         # Station list
-        print(f"\n{Fore.CYAN}Available Stations:")
-        for i, (name, _) in enumerate(filtered_stations[start_idx:end_idx], start=start_idx + 1):
+        lines += ["", f"{Fore.CYAN}Available Stations:"]
+        for i, name in enumerate(filtered_stations.names[start_idx:end_idx], start=start_idx + 1):
             station_idx = i - 1
             is_playing = (station_idx == self.current_station and self.is_playing and
                          self.current_station_name == name)
-            is_favorite = any(f[0] == name for f in self.favorites)
+            is_favorite = name in self._favorites_names
 
             # Build station display
-            status = f"{Fore.GREEN}◄-- PLAYING" if is_playing else ""
-            favorite = "⭐ " if is_favorite else ""
-            print(f"{Fore.YELLOW}{i:3d}. {favorite}{Fore.WHITE}{name[:40]} {status}")
+            row = STATION_ROW_PLAYING if is_playing else STATION_ROW
+            lines.append(row % (i, "⭐ " if is_favorite else "", name[:40]))
 
         # Enhanced controls display
-        print(f"\n{Fore.CYAN}Playback:")
-        print(f"{Fore.GREEN}  [+/-] - Volume Up/Down  {Fore.GREEN}[m] - Mute/Unmute")
-        print(f"{Fore.GREEN}  [k]   - Play/Pause      {Fore.GREEN}[f] - Toggle Favorite")
-
-        print(f"\n{Fore.CYAN}Navigation:")
-        print(f"{Fore.GREEN}  [/] - Search   {Fore.GREEN}[</>] - Prev/Next page")
-        print(f"{Fore.GREEN}  [n] - Next     {Fore.GREEN}[p]   - Previous station")
-        print(f"{Fore.GREEN}  [j] - Jump to  {Fore.GREEN}[c]   - Clear search")
-
-        print(f"\n{Fore.CYAN}Views:")
-        print(f"{Fore.GREEN}  [v] - Switch view (All/Favorites/History)")
-        print(f"{Fore.GREEN}  [s] - Switch playlist")
-
-        print(f"\n{Fore.CYAN}Other:")
-        print(f"{Fore.GREEN}  [a] - Add station   {Fore.GREEN}[d] - Delete station")
-        print(f"{Fore.GREEN}  [h] - Help          {Fore.RED}[e] - Exit")
-
-        return filtered_stations
+        lines += MENU_CONTROLS
+
+        visible_urls = filtered_stations.urls[start_idx:end_idx]
+        return lines, filtered_stations, filtered_stations.name_index(), visible_urls
+
+    def read_command(self, prompt: str) -> Optional[str]:
+        """Read a menu command, or return None if playback status changed while waiting.
+
+        Single-key commands are returned as soon as they are pressed; anything else
+        (station numbers) is echoed and returned when Enter is pressed.
+        """
+        if not sys.stdin.isatty():
+            return input(prompt)
+        if os.name == 'nt':
+            return self.read_command_windows(prompt)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+        fd = sys.stdin.fileno()
+        saved_attrs = termios.tcgetattr(fd)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        buf = ""
+        try:
+            tty.setcbreak(fd)
+            while True:
+                for key, _ in selector.select():
+                    if key.fd == self._wake_r:
+                        try:
+                            while os.read(self._wake_r, 64):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        sys.stdout.write("\n")
+                        return None
+
+                    chunk = os.read(fd, 64).decode('utf-8', 'ignore')
+                    if chunk.startswith("\x1b"):
+                        continue  # Arrow keys and other escape sequences
+                    for ch in chunk:
+                        if ch in "\r\n":
+                            sys.stdout.write("\n")
+                            return buf
+                        if ch in "\x7f\b":
+                            if buf:
+                                buf = buf[:-1]
+                                sys.stdout.write("\b \b")
+                        elif not buf and ch.lower() in SINGLE_KEY_COMMANDS:
+                            sys.stdout.write(ch + "\n")
+                            return ch
+                        elif ch.isprintable():
+                            buf += ch
+                            sys.stdout.write(ch)
+                    sys.stdout.flush()
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved_attrs)
+            selector.close()
+
+    def read_command_windows(self, prompt: str) -> Optional[str]:
+        """Windows variant of read_command that waits on the console input handle instead of select."""
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        stdin_handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        timeout_ms = int(STATUS_POLL_INTERVAL * 1000)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+        buf = ""
+        while True:
+            if self._status_event.is_set():
+                sys.stdout.write("\n")
+                return None
+            # Keys wake this straight away; otherwise recheck the status a few times a second
+            ready = kernel32.WaitForSingleObject(stdin_handle, timeout_ms) == 0  # WAIT_OBJECT_0
+            if ready and not msvcrt.kbhit():
+                # Only key-up, focus or mouse events are queued; they would keep the
+                # handle signalled, so drop them and go back to waiting
+                kernel32.FlushConsoleInputBuffer(stdin_handle)
+                continue
+            while msvcrt.kbhit():
+                ch = msvcrt.getwch()
+                if ch in "\x00\xe0":
+                    msvcrt.getwch()  # Arrow and function keys send a second code
+                    continue
+                if ch == "\x03":
+                    raise KeyboardInterrupt
+                if ch in "\r\n":
+                    sys.stdout.write("\n")
+                    return buf
+                if ch == "\b":
+                    if buf:
+                        buf = buf[:-1]
+                        sys.stdout.write("\b \b")
+                elif not buf and ch.lower() in SINGLE_KEY_COMMANDS:
+                    sys.stdout.write(ch + "\n")
+                    return ch
+                elif ch.isprintable():
+                    buf += ch
+                    sys.stdout.write(ch)
+            sys.stdout.flush()
+
+    def shutdown(self):
+        """Stop playback, save state and drop queued background work before exiting."""
+        self.stop_station()
+        self.save_config()
+        self.save_url_cache()
+        # Queued probes would otherwise each run, with their timeouts, before the interpreter exits
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._spawn_pool.shutdown(wait=False, cancel_futures=True)
 
     def switch_view_mode(self):
         """Switch between different view modes."""
@@ -641,9 +1275,6 @@ class RadioPlayer:
             input("Press Enter to exit.")
             return
 
-        # Start playback monitoring thread
-        threading.Thread(target=self.monitor_playback, daemon=True).start()
-
         # Resume last played station if requested
         if self.last_played_station:
             choice = input(f"{Fore.CYAN}Resume last played station? (y/n): ").strip().lower()
@@ -653,26 +1284,29 @@ class RadioPlayer:
         while True:
             try:
                 # Check for status updates
-                while not self.status_queue.empty():
-                    status = self.status_queue.get_nowait()
-                    if status == "stopped":
-                        self.is_playing = False
-
-                filtered_stations = self.display_menu()
+                if self._status_event.is_set():
+                    self._status_event.clear()
+                    while self._status_dq:
+                        status = self._status_dq.popleft()
+                        if status == "stopped":
+                            self.is_playing = False
+
+                filtered_stations, name_to_idx = self.display_menu()
                 total_pages = ceil(len(filtered_stations) / STATIONS_PER_PAGE)
 
-                choice = input(f"\n{Fore.CYAN}Enter your choice: ").strip().lower()
+                choice = self.read_command(f"\n{Fore.CYAN}Enter your choice: ")
+                if choice is None:
+                    continue  # Playback status changed; redraw the menu
+                choice = choice.strip().lower()
 
                 if choice == 'e':
                     print("Exiting the radio station selector. Goodbye!")
-                    self.stop_station()
-                    return
+                    return  # main() runs shutdown()
 
                 if choice in ['n', 'p']:
                     if filtered_stations:
                         # Find current station in filtered list
-                        current_name = next((name for name, _ in filtered_stations if name == self.current_station_name), None)
-                        current_filtered_idx = next((i for i, (name, _) in enumerate(filtered_stations) if name == current_name), 0)
+                        current_filtered_idx = name_to_idx.get(self.current_station_name, 0)
 
                         if choice == 'n':
                             next_idx = (current_filtered_idx + 1) % len(filtered_stations)
@@ -697,10 +1331,9 @@ class RadioPlayer:
                     if self.current_page > 1:
                         self.current_page -= 1
                 elif choice == 'f' and self.current_station_name:
-                    current_station = next((s for s in self.get_current_stations()
-                                         if s[0] == self.current_station_name), None)
-                    if current_station:
-                        self.toggle_favorite(current_station)
+                    station_idx = self.current_name_index().get(self.current_station_name)
+                    if station_idx is not None:
+                        self.toggle_favorite(self.get_current_stations()[station_idx])
                 elif choice == '/':
                     self.search_term = input("Enter search term: ").strip()
                     self.current_page = 1
@@ -711,6 +1344,7 @@ class RadioPlayer:
                     self.switch_view_mode()
                 elif choice == 's':
                     self.switch_playlist()
+                    self._prev_lines = []
                 elif choice == 'j':
                     try:
                         station_number = int(input(f"{Fore.CYAN}Enter station number: ")) - 1
@@ -736,6 +1370,7 @@ class RadioPlayer:
                         current_stations = self.get_current_stations()
                         current_stations.append((name, link))
                         self.playlists[self.current_playlist] = current_stations
+                        self.stations_changed(self.current_playlist)
                         self.save_stations(current_stations, self.current_playlist)
                 elif choice == 'd':
                     try:
@@ -744,12 +1379,14 @@ class RadioPlayer:
                         if 0 <= station_number < len(current_stations):
                             del current_stations[station_number]
                             self.playlists[self.current_playlist] = current_stations
+                            self.stations_changed(self.current_playlist)
                             self.save_stations(current_stations, self.current_playlist)
                     except ValueError:
                         print(f"{Fore.RED}Invalid input.")
                         input("Press Enter to continue...")
                 elif choice == 'h':
                     display_help()
+                    self._prev_lines = []
                 else:
                     print(f"{Fore.RED}Invalid option.")
                     input("Press Enter to continue...")
@@ -759,11 +1396,18 @@ class RadioPlayer:
                 input("Press Enter to continue...")
 
 def main():
-    if not check_dependencies():
-        input("Press Enter to exit.")
-        return
+    # RadioPlayer.run checks dependencies before starting
     player = RadioPlayer()
-    player.run()
+    if os.name != 'nt':
+        # ffplay runs in its own session, so a closed terminal or kill never reaches it;
+        # turn those into a normal exit so the finally below stops playback
+        for signum in (signal.SIGHUP, signal.SIGTERM):
+            signal.signal(signum, lambda signum, frame: sys.exit(0))
+    try:
+        player.run()
+    finally:
+        # Runs for the exit command as well as Ctrl-C and the signals above
+        player.shutdown()
 
 if __name__ == "__main__":
     main()